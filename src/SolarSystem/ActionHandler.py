@@ -3,8 +3,20 @@ from panda3d.core import TextNode
 from direct.interval.IntervalGlobal import *
 from direct.gui.DirectGui import *
 from direct.showbase.DirectObject import DirectObject
+from direct.task import Task
 import sys
 
+from Constants import MODELS_PATH
+
+PLANET_NAMES = ("sun", "earth", "moon", "mars", "mercury", "venus", "jupiter")
+EASTER_EGG_KEYS = (("b", "borko"), ("x", "team"), ("y", "marm"),
+                   ("c", "brezina"), ("v", "testbild"))
+
+# Pfade und Schluessel einmal beim Import zusammenbauen
+EASTER_EGG_PATHS = dict((name, MODELS_PATH + name + ".jpg")
+                        for name in [name for key, name in EASTER_EGG_KEYS] + ["weiss"])
+TEX_KEYS = dict((planet, planet + "Tex") for planet in PLANET_NAMES)
+
 class ActionHandler(DirectObject):
     def genLabelText(self, text, i):
         return OnscreenText(text=text, pos=(0.06, -.06 * (i + 0.5)), fg=(1, 1, 1, 1),
@@ -15,35 +27,52 @@ class ActionHandler(DirectObject):
         self.base = base
         self.cbAttDic = cbAttDic
         self.cbAttTex = cbAttTex
+        self.texCache = {}
+        # Die beim Start geladenen Texturen merken, um sie mit [T]
+        # wiederherzustellen
+        self.origTextures = dict((planet, cbAttTex[TEX_KEYS[planet]])
+                                 for planet in PLANET_NAMES
+                                 if TEX_KEYS[planet] in cbAttTex)
+        self.requestedTex = None
 
         self.instructionText = 0
-        self.spaceKeyEventText = 0
-        self.speedUpText = 0
-        self.slowDownText = 0
+        self.helpText = 0
 
         self.simRunning = True
         self.instruction = True
         self.origTex = True
 
-        self.instructionText = 0
-        self.spaceKeyEventText = 0
-        self.skeyEventText = 0
-        self.ykeyEventText = 0
-        self.vkeyEventText = 0
         self.ekeyEventText = 0
-        self.mkeyEventText = 0
-        self.jkeyEventText = 0
-        self.speedUpText = 0
-        self.slowDownText = 0
-        self.toggleTextureText = 0
-        self.resetSolarSystemText = 0
         self.speedText = 0
+        self.lastDisplayedSpeed = None
 
     def initAll(self):
+        self.bindIntervals()
         self.displayLayout()
         self.displayLayoutAction()
         self.activateAction()
 
+    def bindIntervals(self):
+        # Die Intervalle aendern sich nach dem Erstellen nicht mehr, daher
+        # werden sie einmal gesammelt statt bei jedem Tastendruck nachzuschlagen
+        self.allIntervals = tuple(self.cbAttDic.values())
+
+    def setAllPlayRates(self, rate):
+        for interval in self.allIntervals:
+            interval.setPlayRate(rate)
+
+    def adjustAllPlayRates(self, delta):
+        for interval in self.allIntervals:
+            interval.setPlayRate(interval.getPlayRate() + delta)
+
+    def updateSpeedDisplay(self):
+        # setText baut das Label neu auf, daher nur bei Aenderung aufrufen
+        speed = self.cbAttDic["sunDay"].getPlayRate()
+        if speed == self.lastDisplayedSpeed:
+            return
+        self.lastDisplayedSpeed = speed
+        self.speedText.setText("Speed x %s" % speed)
+
     def displayLayout(self):
         self.title = OnscreenText(
             text="Fock & Polydor - SolarSystem",
@@ -53,38 +82,23 @@ class ActionHandler(DirectObject):
     def displayLayoutAction(self):
         self.instructionText = self.genLabelText("[I]: Hide Instructions", 1)
         self.speedText = self.genLabelText("Speed x 1", 2)
-        self.speedUpText = self.genLabelText("[+]: SPEED UP!", 3)
-        self.slowDownText = self.genLabelText("[-]: slow down...", 4)
-        self.toggleTextureText = self.genLabelText("[T]: Toggle Texture", 5)
-        self.resetSolarSystemText = self.genLabelText("[R]: Reset Solar System", 6)
-        self.easterEggText = self.genLabelText("[X, Y, C, B]: Something Special", 7)
-        self.spaceKeyEventText = self.genLabelText("[SPACE]: Toggle entire Solar System", 8)
-
-
+        # Die statischen Anweisungen teilen sich ein mehrzeiliges Label
+        self.helpText = self.genLabelText("\n".join([
+            "[+]: SPEED UP!",
+            "[-]: slow down...",
+            "[T]: Toggle Texture",
+            "[R]: Reset Solar System",
+            "[X, Y, C, B, V]: Something Special",
+            "[SPACE]: Toggle entire Solar System",
+        ]), 3)
 
     def showLayoutAction(self):
         self.instructionText.setText("[I]: Hide Instructions")
-        self.spaceKeyEventText.setText("[SPACE]: Toggle entire Solar System")
-        self.speedUpText.setText("[+]: SPEED UP!")
-        self.slowDownText.setText("[-]: slow down...")
-        self.toggleTextureText.setText("[T]: Toggle Texture")
-        self.resetSolarSystemText.setText("[R]: Reset Solar System")
-        self.easterEggText.setText("[X, Y, C, B, V]: Something Special")
-        #self.speedText.setText("Speed x 1.0")
+        self.helpText.show()
 
     def hideLayoutAction(self):
-        self.instructionText.setText("")
-        self.spaceKeyEventText.setText("")
-        self.speedUpText.setText("")
-        self.slowDownText.setText("")
-        self.toggleTextureText.setText("")
-        self.resetSolarSystemText.setText("")
-        self.easterEggText.setText("")
-        #self.speedText.setText("")
-
-        self.instructionText = self.genLabelText("[I]: Show Instructions", 1)
-
-
+        self.instructionText.setText("[I]: Show Instructions")
+        self.helpText.hide()
 
     def activateAction(self):
         self.accept("escape", sys.exit)
@@ -96,11 +110,8 @@ class ActionHandler(DirectObject):
         self.accept("i", self.toggleInstructions)
         self.accept("r", self.resetSolarSystem)
         self.accept("z", self.unlimit)
-        self.accept("b", self.borkoTex)
-        self.accept("x", self.teamTex)
-        self.accept("y", self.marmTex)
-        self.accept("c", self.brezinaTex)
-        self.accept("v", self.testbildTex)
+        for key, name in EASTER_EGG_KEYS:
+            self.accept(key, self.loadEasterEggTex, [name])
 
     def unlimit(self):
         #earth
@@ -124,101 +135,23 @@ class ActionHandler(DirectObject):
         print ("SpeedUP")
 
         if (self.cbAttDic["sunDay"].getPlayRate() == -1):
-            #sun
-            self.cbAttDic["sunDay"].setPlayRate(1)
-            #earth
-            self.cbAttDic["earthOrbit"].setPlayRate(1)
-            self.cbAttDic["earthDay"].setPlayRate(1)
-            #moon
-            self.cbAttDic["moonOrbit"].setPlayRate(1)
-            self.cbAttDic["moonDay"].setPlayRate(1)
-            #mars
-            self.cbAttDic["marsOrbit"].setPlayRate(1)
-            self.cbAttDic["marsDay"].setPlayRate(1)
-            #mercury
-            self.cbAttDic["mercuryOrbit"].setPlayRate(1)
-            self.cbAttDic["mercuryDay"].setPlayRate(1)
-            #jupiter
-            self.cbAttDic["jupiterOrbit"].setPlayRate(1)
-            self.cbAttDic["jupiterDay"].setPlayRate(1)
-            #venus
-            self.cbAttDic["venusOrbit"].setPlayRate(1)
-            self.cbAttDic["venusDay"].setPlayRate(1)
+            self.setAllPlayRates(1)
         else:
-            #sun
-            self.cbAttDic["sunDay"].setPlayRate(self.cbAttDic["sunDay"].getPlayRate()+1)
-            #earth
-            self.cbAttDic["earthOrbit"].setPlayRate(self.cbAttDic["earthOrbit"].getPlayRate()+1)
-            self.cbAttDic["earthDay"].setPlayRate(self.cbAttDic["earthDay"].getPlayRate()+1)
-            #moon
-            self.cbAttDic["moonOrbit"].setPlayRate(self.cbAttDic["moonOrbit"].getPlayRate()+1)
-            self.cbAttDic["moonDay"].setPlayRate(self.cbAttDic["moonDay"].getPlayRate()+1)
-            #mars
-            self.cbAttDic["marsOrbit"].setPlayRate(self.cbAttDic["marsOrbit"].getPlayRate()+1)
-            self.cbAttDic["marsDay"].setPlayRate(self.cbAttDic["marsDay"].getPlayRate()+1)
-            #mercury
-            self.cbAttDic["mercuryOrbit"].setPlayRate(self.cbAttDic["mercuryOrbit"].getPlayRate()+1)
-            self.cbAttDic["mercuryDay"].setPlayRate(self.cbAttDic["mercuryDay"].getPlayRate()+1)
-            #jupiter
-            self.cbAttDic["jupiterOrbit"].setPlayRate(self.cbAttDic["jupiterOrbit"].getPlayRate()+1)
-            self.cbAttDic["jupiterDay"].setPlayRate(self.cbAttDic["jupiterDay"].getPlayRate()+1)
-            #venus
-            self.cbAttDic["venusOrbit"].setPlayRate(self.cbAttDic["venusOrbit"].getPlayRate()+1)
-            self.cbAttDic["venusDay"].setPlayRate(self.cbAttDic["venusDay"].getPlayRate()+1)
-
-
-
-        self.speedText.setText("Speed x %s" % self.cbAttDic["sunDay"].getPlayRate())
+            self.adjustAllPlayRates(1)
+
+        self.updateSpeedDisplay()
         print (self.cbAttDic["sunDay"].getPlayRate())
 
 
     def slowDown(self):
         print ("SlowDown")
         if (self.cbAttDic["sunDay"].getPlayRate() == 1):
-            #sun
-            self.cbAttDic["sunDay"].setPlayRate(-1)
-            #earth
-            self.cbAttDic["earthOrbit"].setPlayRate(-1)
-            self.cbAttDic["earthDay"].setPlayRate(-1)
-            #moon
-            self.cbAttDic["moonOrbit"].setPlayRate(-1)
-            self.cbAttDic["moonDay"].setPlayRate(-1)
-            #mars
-            self.cbAttDic["marsOrbit"].setPlayRate(-1)
-            self.cbAttDic["marsDay"].setPlayRate(-1)
-            #mercury
-            self.cbAttDic["mercuryOrbit"].setPlayRate(-1)
-            self.cbAttDic["mercuryDay"].setPlayRate(-1)
-            #jupiter
-            self.cbAttDic["jupiterOrbit"].setPlayRate(-1)
-            self.cbAttDic["jupiterDay"].setPlayRate(-1)
-            #venus
-            self.cbAttDic["venusOrbit"].setPlayRate(-1)
-            self.cbAttDic["venusDay"].setPlayRate(-1)
+            self.setAllPlayRates(-1)
         else:
-            #sun
-            self.cbAttDic["sunDay"].setPlayRate(self.cbAttDic["sunDay"].getPlayRate()-1)
-            #earth
-            self.cbAttDic["earthOrbit"].setPlayRate(self.cbAttDic["earthOrbit"].getPlayRate()-1)
-            self.cbAttDic["earthDay"].setPlayRate(self.cbAttDic["earthDay"].getPlayRate()-1)
-            #moon
-            self.cbAttDic["moonOrbit"].setPlayRate(self.cbAttDic["moonOrbit"].getPlayRate()-1)
-            self.cbAttDic["moonDay"].setPlayRate(self.cbAttDic["moonDay"].getPlayRate()-1)
-            #mars
-            self.cbAttDic["marsOrbit"].setPlayRate(self.cbAttDic["marsOrbit"].getPlayRate()-1)
-            self.cbAttDic["marsDay"].setPlayRate(self.cbAttDic["marsDay"].getPlayRate()-1)
-            #mercury
-            self.cbAttDic["mercuryOrbit"].setPlayRate(self.cbAttDic["mercuryOrbit"].getPlayRate()-1)
-            self.cbAttDic["mercuryDay"].setPlayRate(self.cbAttDic["mercuryDay"].getPlayRate()-1)
-            #jupiter
-            self.cbAttDic["jupiterOrbit"].setPlayRate(self.cbAttDic["jupiterOrbit"].getPlayRate()-1)
-            self.cbAttDic["jupiterDay"].setPlayRate(self.cbAttDic["jupiterDay"].getPlayRate()-1)
-            #venus
-            self.cbAttDic["venusOrbit"].setPlayRate(self.cbAttDic["venusOrbit"].getPlayRate()-1)
-            self.cbAttDic["venusDay"].setPlayRate(self.cbAttDic["venusDay"].getPlayRate()-1)
+            self.adjustAllPlayRates(-1)
 
         print (self.cbAttDic["sunDay"].getPlayRate())
-        self.speedText.setText("Speed x %s" % self.cbAttDic["sunDay"].getPlayRate())
+        self.updateSpeedDisplay()
 
     def handleEarth(self):
         self.togglePlanet("Earth", self.cbAttDic["earthDay"],
@@ -231,58 +164,16 @@ class ActionHandler(DirectObject):
     def handleAll(self):
         # When the mouse is clicked, if the simulation is running pause all the
         # planets and sun, otherwise resume it
+        # simRunning already tells us the state we are leaving, so there is
+        # no need to ask every interval whether it is playing
         if self.simRunning:
             print("Pausing Simulation")
-            # For each planet, check if it is moving and if so, pause it
-            # Sun
-            if self.cbAttDic["sunDay"].isPlaying():
-                self.togglePlanet("Sun", self.cbAttDic["sunDay"], None,
-                                  self.skeyEventText)
-            if self.cbAttDic["mercuryDay"].isPlaying():
-                self.togglePlanet("Mercury", self.cbAttDic["mercuryDay"],
-                                  self.cbAttDic["mercuryOrbit"], self.ykeyEventText)
-            # Venus
-            if self.cbAttDic["venusDay"].isPlaying():
-                self.togglePlanet("Venus", self.cbAttDic["venusDay"],
-                                  self.cbAttDic["venusOrbit"], self.vkeyEventText)
-            #Earth and moon
-            if self.cbAttDic["earthDay"].isPlaying():
-                self.togglePlanet("Earth", self.cbAttDic["earthDay"],
-                                  self.cbAttDic["earthOrbit"], self.ekeyEventText)
-                self.togglePlanet("Moon", self.cbAttDic["moonDay"],
-                                  self.cbAttDic["moonOrbit"])
-            # Mars
-            if self.cbAttDic["marsDay"].isPlaying():
-                self.togglePlanet("Mars", self.cbAttDic["marsDay"],
-                                  self.cbAttDic["marsOrbit"], self.mkeyEventText)
-            # jupiter
-            if self.cbAttDic["jupiterDay"].isPlaying():
-                self.togglePlanet("jupiter", self.cbAttDic["jupiterDay"],
-                                  self.cbAttDic["jupiterOrbit"], self.jkeyEventText)
+            for interval in self.allIntervals:
+                interval.pause()
         else:
-            #"The simulation is paused, so resume it
             print("Resuming Simulation")
-            # the not operator does the reverse of the previous code
-            if not self.cbAttDic["sunDay"].isPlaying():
-                self.togglePlanet("Sun", self.cbAttDic["sunDay"], None,
-                                  self.skeyEventText)
-            if not self.cbAttDic["mercuryDay"].isPlaying():
-                self.togglePlanet("Mercury", self.cbAttDic["mercuryDay"],
-                                  self.cbAttDic["mercuryOrbit"], self.ykeyEventText)
-            if not self.cbAttDic["venusDay"].isPlaying():
-                self.togglePlanet("Venus", self.cbAttDic["venusDay"],
-                                  self.cbAttDic["venusOrbit"], self.vkeyEventText)
-            if not self.cbAttDic["earthDay"].isPlaying():
-                self.togglePlanet("Earth", self.cbAttDic["earthDay"],
-                                  self.cbAttDic["earthOrbit"], self.ekeyEventText)
-                self.togglePlanet("Moon", self.cbAttDic["moonDay"],
-                                  self.cbAttDic["moonOrbit"])
-            if not self.cbAttDic["marsDay"].isPlaying():
-                self.togglePlanet("Mars", self.cbAttDic["marsDay"],
-                                  self.cbAttDic["marsOrbit"], self.mkeyEventText)
-            if not self.cbAttDic["jupiterDay"].isPlaying():
-                self.togglePlanet("jupiter", self.cbAttDic["jupiterDay"],
-                                  self.cbAttDic["jupiterOrbit"], self.mkeyEventText)
+            for interval in self.allIntervals:
+                interval.resume()
         # toggle self.simRunning
         self.simRunning = not self.simRunning
     # end handleMouseClick
@@ -311,105 +202,57 @@ class ActionHandler(DirectObject):
             self.origTex = True
             self.resumeToNormalTex()
 
-    def testbildTex(self):
-            self.origTex = False
-            self.loadTex("testbild")
-
-    def borkoTex(self):
-            self.origTex = False
-            self.loadTex("borko")
-
-    def brezinaTex(self):
-            self.origTex = False
-            self.loadTex("brezina")
-
-    def teamTex(self):
-            self.origTex = False
-            self.loadTex("team")
-
-    def marmTex(self):
-            self.origTex = False
-            self.loadTex("marm")
+    def loadEasterEggTex(self, name):
+        self.origTex = False
+        self.loadTex(name)
 
     def loadTex(self, str):
-        # toggle sun
-            self.cbAttTex["sunTex"] = loader.loadTexture("../../models/%s.jpg" % str)
-            self.cbAttTex["sun"].setTexture(self.cbAttTex["sunTex"], 1)
-
-            # toggle earth
-            self.cbAttTex["earthTex"] = loader.loadTexture("../../models/%s.jpg" % str)
-            self.cbAttTex["earth"].setTexture(self.cbAttTex["earthTex"], 1)
-
-            # toggle moon
-            self.cbAttTex["moonTex"] = loader.loadTexture("../../models/%s.jpg" % str)
-            self.cbAttTex["moon"].setTexture(self.cbAttTex["moonTex"], 1)
-
-            # toggle mars
-            self.cbAttTex["marsTex"] = loader.loadTexture("../../models/%s.jpg" % str)
-            self.cbAttTex["mars"].setTexture(self.cbAttTex["marsTex"], 1)
-
-            # toggle mercury
-            self.cbAttTex["mercuryTex"] = loader.loadTexture("../../models/%s.jpg" % str)
-            self.cbAttTex["mercury"].setTexture(self.cbAttTex["mercuryTex"], 1)
-
-            # toggle venus
-            self.cbAttTex["venusTex"] = loader.loadTexture("../../models/%s.jpg" % str)
-            self.cbAttTex["venus"].setTexture(self.cbAttTex["venusTex"], 1)
-
-            # toggle jupiter
-            self.cbAttTex["jupiterTex"] = loader.loadTexture("../../models/%s.jpg" % str)
-            self.cbAttTex["jupiter"].setTexture(self.cbAttTex["jupiterTex"], 1)
+        # alle Himmelskoerper bekommen dieselbe Textur
+        path = EASTER_EGG_PATHS[str]
+        self.requestedTex = path
+        if path in self.texCache:
+            self.setTexForAll(self.texCache[path])
+        else:
+            # Beim ersten Mal im Lade-Thread von der Platte lesen
+            taskMgr.add(self.loadTexTask, "loadTex", taskChain="textureLoader",
+                        extraArgs=[path])
+
+    def loadTexTask(self, path):
+        # laeuft im Thread "textureLoader"
+        try:
+            tex = loader.loadTexture(path)
+        except IOError as e:
+            print("Warning: Could not load texture %s: %s" % (path, e))
+            return Task.done
+        # Den Szenengraph nur im Haupt-Thread aendern
+        taskMgr.add(self.texLoaded, "texLoaded", extraArgs=[path, tex])
+        return Task.done
+
+    def texLoaded(self, path, tex):
+        self.texCache[path] = tex
+        # nur setzen, wenn inzwischen keine andere Textur gewaehlt wurde
+        if self.requestedTex == path:
+            self.setTexForAll(tex)
+        return Task.done
+
+    def setTexForAll(self, tex):
+        for planet in PLANET_NAMES:
+            model = self.cbAttTex.get(planet)
+            if model is None:
+                continue
+            self.cbAttTex[TEX_KEYS[planet]] = tex
+            model.setTexture(tex, 1)
 
     def resumeToNormalTex(self):
-        # toggle sun
-            self.cbAttTex["sunTex"] = loader.loadTexture("../../models/sun_1k_tex.jpg")
-            self.cbAttTex["sun"].setTexture(self.cbAttTex["sunTex"], 1)
-
-            # toggle earth
-            self.cbAttTex["earthTex"] = loader.loadTexture("../../models/earth_1k_tex.jpg")
-            self.cbAttTex["earth"].setTexture(self.cbAttTex["earthTex"], 1)
-
-           # toggle moon
-            self.cbAttTex["moonTex"] = loader.loadTexture("../../models/moon_1k_tex.jpg")
-            self.cbAttTex["moon"].setTexture(self.cbAttTex["moonTex"], 1)
-
-           # toggle mars
-            self.cbAttTex["marsTex"] = loader.loadTexture("../../models/mars_1k_tex.jpg")
-            self.cbAttTex["mars"].setTexture(self.cbAttTex["marsTex"], 1)
-
-           # toggle mercury
-            self.cbAttTex["mercuryTex"] = loader.loadTexture("../../models/mercury_1k_tex.jpg")
-            self.cbAttTex["mercury"].setTexture(self.cbAttTex["mercuryTex"], 1)
-
-           # toggle jupiter
-            self.cbAttTex["jupiterTex"] = loader.loadTexture("../../models/jupiter.jpg")
-            self.cbAttTex["jupiter"].setTexture(self.cbAttTex["jupiterTex"], 1)
-
-           # toggle venus
-            self.cbAttTex["venusTex"] = loader.loadTexture("../../models/venus_1k_tex.jpg")
-            self.cbAttTex["venus"].setTexture(self.cbAttTex["venusTex"], 1)
+        self.requestedTex = None
+        for planet, tex in self.origTextures.items():
+            model = self.cbAttTex.get(planet)
+            if model is None:
+                continue
+            self.cbAttTex[TEX_KEYS[planet]] = tex
+            model.setTexture(tex, 1)
 
     def resetSolarSystem(self):
-        #sun
-        self.cbAttDic["sunDay"].setPlayRate(0)
-        #earth
-        self.cbAttDic["earthOrbit"].setPlayRate(0)
-        self.cbAttDic["earthDay"].setPlayRate(0)
-        #moon
-        self.cbAttDic["moonOrbit"].setPlayRate(0)
-        self.cbAttDic["moonDay"].setPlayRate(0)
-        #mars
-        self.cbAttDic["marsOrbit"].setPlayRate(0)
-        self.cbAttDic["marsDay"].setPlayRate(0)
-        #mercury
-        self.cbAttDic["mercuryOrbit"].setPlayRate(0)
-        self.cbAttDic["mercuryDay"].setPlayRate(0)
-        #jupiter
-        self.cbAttDic["jupiterOrbit"].setPlayRate(0)
-        self.cbAttDic["jupiterDay"].setPlayRate(0)
-        #venus
-        self.cbAttDic["venusOrbit"].setPlayRate(0)
-        self.cbAttDic["venusDay"].setPlayRate(0)
-
-        self.speedText.setText("Speed x %s" % self.cbAttDic["sunDay"].getPlayRate())
+        self.setAllPlayRates(0)
 
+        self.updateSpeedDisplay()
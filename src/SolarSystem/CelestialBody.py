@@ -1,5 +1,12 @@
+from panda3d.core import NodePath
+
+from Constants import MODELS_PATH
+
+
 class CelestialBody(object):
-    def __init__(self, sizescale, orbitscale, yearscale, dayscale):
+    def __init__(self, sizescale, orbitscale, yearscale, dayscale, root=None):
+        # Alle Himmelskoerper haengen unter diesem Knoten (Standard: render)
+        self.root = root if root is not None else render
         self.sizescale = sizescale
         self.orbitscale = orbitscale
         self.dayscale = dayscale
@@ -9,6 +16,17 @@ class CelestialBody(object):
         self.cbAttDic = {}
         self.cbAttTex = {}
         self.specialSun = 0
+        self.planetMesh = None
+
+    def instancePlanetMesh(self, name):
+        # Die Kugel wird nur einmal geladen; jeder Himmelskoerper bekommt
+        # einen eigenen Knoten (fuer Textur, Groesse, Position), unter dem
+        # dieselbe ModelRoot instanziert wird
+        if self.planetMesh is None:
+            self.planetMesh = loader.loadModel(MODELS_PATH + "planet_sphere")
+        body = NodePath(name)
+        self.planetMesh.instanceTo(body)
+        return body
 
     def loadAllCelestialBodys(self):
         self.loadSun()
@@ -32,11 +50,11 @@ class CelestialBody(object):
     def loadSun(self):
         # Hier wird die Form fuer die Sonne geladen
         # In diesem Fall ist eine planet_sphere
-        self.sun = loader.loadModel("../../models/planet_sphere")
+        self.sun = self.instancePlanetMesh("sun")
         # Hier wird die Sonne ins Zentrum des SolarSystems platziert
-        self.sun.reparentTo(render)
+        self.sun.reparentTo(self.root)
         # Hier wird der Sonne die gelbe Sonnen Textur geladen
-        self.sun_tex = loader.loadTexture("../../models/sun_1k_tex.jpg")
+        self.sun_tex = loader.loadTexture(MODELS_PATH + "sun_1k_tex.jpg")
         # Hier wird die Textur gesetzt
         self.sun.setTexture(self.sun_tex, 1)
         # Hier wird die Groesse des Himmelskoerper gesetzt
@@ -59,10 +77,10 @@ class CelestialBody(object):
 
     def loadEarth(self):
         #Hier wird die Erde an die Sonne/render (den Mittelpunkt) angehaengt
-        self.orbit_root_earth = render.attachNewNode('orbit_root_earth')
+        self.orbit_root_earth = self.root.attachNewNode('orbit_root_earth')
         # Load earth
-        self.earth = loader.loadModel("../../models/planet_sphere")
-        self.earth_tex = loader.loadTexture("../../models/earth_1k_tex.jpg")
+        self.earth = self.instancePlanetMesh("earth")
+        self.earth_tex = loader.loadTexture(MODELS_PATH + "earth_1k_tex.jpg")
         self.earth.setTexture(self.earth_tex, 1)
         self.earth.reparentTo(self.orbit_root_earth)
         self.earth.setScale(self.sizescale)
@@ -98,8 +116,8 @@ class CelestialBody(object):
         self.orbit_root_moon.setPos(self.orbitscale, 0, 0)
 
         # Load the moon
-        self.moon = loader.loadModel("../../models/planet_sphere")
-        self.moon_tex = loader.loadTexture("../../models/moon_1k_tex.jpg")
+        self.moon = self.instancePlanetMesh("moon")
+        self.moon_tex = loader.loadTexture(MODELS_PATH + "moon_1k_tex.jpg")
         self.moon.setTexture(self.moon_tex, 1)
         self.moon.reparentTo(self.orbit_root_moon)
         self.moon.setScale(0.1 * self.sizescale)
@@ -125,11 +143,11 @@ class CelestialBody(object):
         self.cbAttDic["moonOrbit"] = self.orbit_period_moon
 
     def loadMars(self):
-        self.orbit_root_mars = render.attachNewNode("orbit_root_mars")
+        self.orbit_root_mars = self.root.attachNewNode("orbit_root_mars")
 
         # Load Mars
-        self.mars = loader.loadModel("../../models/planet_sphere")
-        self.mars_tex = loader.loadTexture("../../models/mars_1k_tex.jpg")
+        self.mars = self.instancePlanetMesh("mars")
+        self.mars_tex = loader.loadTexture(MODELS_PATH + "mars_1k_tex.jpg")
         self.mars.setTexture(self.mars_tex, 1)
         self.mars.reparentTo(self.orbit_root_mars)
         self.mars.setPos(1.52 * self.orbitscale, 0, 0)
@@ -154,10 +172,10 @@ class CelestialBody(object):
         self.cbAttDic["marsOrbit"] = self.orbit_period_mars
 
     def loadMercury(self):
-        self.orbit_root_mercury = render.attachNewNode('orbit_root_mercury')
+        self.orbit_root_mercury = self.root.attachNewNode('orbit_root_mercury')
         # Load mercury
-        self.mercury = loader.loadModel("../../models/planet_sphere")
-        self.mercury_tex = loader.loadTexture("../../models/mercury_1k_tex.jpg")
+        self.mercury = self.instancePlanetMesh("mercury")
+        self.mercury_tex = loader.loadTexture(MODELS_PATH + "mercury_1k_tex.jpg")
         self.mercury.setTexture(self.mercury_tex, 1)
         self.mercury.reparentTo(self.orbit_root_mercury)
         self.mercury.setPos(0.38 * self.orbitscale, 0, 0)
@@ -182,11 +200,11 @@ class CelestialBody(object):
         self.cbAttDic["mercuryOrbit"] = self.orbit_period_mercury
 
     def loadVenus(self):
-        self.orbit_root_venus = render.attachNewNode('orbit_root_venus')
+        self.orbit_root_venus = self.root.attachNewNode('orbit_root_venus')
 
         # Load Venus
-        self.venus = loader.loadModel("../../models/planet_sphere")
-        self.venus_tex = loader.loadTexture("../../models/venus_1k_tex.jpg")
+        self.venus = self.instancePlanetMesh("venus")
+        self.venus_tex = loader.loadTexture(MODELS_PATH + "venus_1k_tex.jpg")
         self.venus.setTexture(self.venus_tex, 1)
         self.venus.reparentTo(self.orbit_root_venus)
         self.venus.setPos(0.72 * self.orbitscale, 0, 0)
@@ -211,11 +229,11 @@ class CelestialBody(object):
         self.cbAttDic["venusOrbit"] = self.orbit_period_venus
 
     def loadJupiter(self):
-        self.orbit_root_jupiter = render.attachNewNode('orbit_root_jupiter')
+        self.orbit_root_jupiter = self.root.attachNewNode('orbit_root_jupiter')
 
         # Load jupiter
-        self.jupiter = loader.loadModel("../../models/planet_sphere")
-        self.jupiter_tex = loader.loadTexture("../../models/jupiter.jpg")
+        self.jupiter = self.instancePlanetMesh("jupiter")
+        self.jupiter_tex = loader.loadTexture(MODELS_PATH + "jupiter.jpg")
         self.jupiter.setTexture(self.jupiter_tex, 1)
         self.jupiter.reparentTo(self.orbit_root_jupiter)
         self.jupiter.setPos(2 * self.orbitscale, 0, 0)
@@ -0,0 +1 @@
+MODELS_PATH = "../../models/"
@@ -14,13 +14,17 @@ class Main(DirectObject):
     dayscale = yearscale / 365.0 * 5
 
     base = ShowBase()
+    # Eigener Thread zum Laden von Texturen, damit Tastendruecke das Bild
+    # nicht anhalten
+    base.taskMgr.setupTaskChain("textureLoader", numThreads=1)
 
     camera = CameraHandler.CameraHandler(base)
 
     u = Universe.Universe(base)
     u.initSky()
 
-    cb = CelestialBody.CelestialBody(sizescale, orbitscale, yearscale, dayscale)
+    cb = CelestialBody.CelestialBody(sizescale, orbitscale, yearscale, dayscale,
+                                     u.sceneRoot)
     cb.loadAllCelestialBodys()
     cb.rotateAllCelestialBodys()
 
@@ -4,6 +4,8 @@ from panda3d.core import AmbientLight, DirectionalLight
 from panda3d.core import LPoint3, LVector3
 from panda3d.core import Filename
 
+from Constants import MODELS_PATH
+
 class SpecialClass(object):
     def __init__(self, base, sun):
         self.base = base
@@ -12,10 +14,9 @@ class SpecialClass(object):
         base.enableParticles()
         self.t = sun
         self.t.setPos(0, 0, 0)
-        self.t.reparentTo(render)
         self.setupLights()
         self.p = ParticleEffect()
-        self.loadParticleConfig('../../models/fireish.ptf')
+        self.loadParticleConfig(MODELS_PATH + 'fireish.ptf')
 
     def loadParticleConfig(self, filename):
         # Start of the code from steam.ptf
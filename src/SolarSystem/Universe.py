@@ -1,9 +1,23 @@
-from direct.showbase.ShowBase import ShowBase
+from panda3d.core import AmbientLight, DirectionalLight
+from panda3d.core import LVector3, VBase4
+from panda3d.core import Texture
+from direct.task import Task
 
-from panda3d.core import *  # Contains most of Panda's modules
-from direct.gui.DirectGui import *  # Imports Gui objects we use for putting
-# text on the screen
-import sys
+from Constants import MODELS_PATH
+
+SKY_MODEL_PATH = MODELS_PATH + "solar_sky_sphere"
+STARS_TEXTURE_PATH = MODELS_PATH + "stars_1k_tex.jpg"
+
+SUN_LIGHT_COLOR = VBase4(0.8, 0.8, 0.8, 1)
+SUN_LIGHT_DIRECTION = LVector3(0, 0, -1)
+AMBIENT_LIGHT_COLOR = VBase4(0.2, 0.2, 0.2, 1)
+
+# (Typ, Name, Farbe, Richtung) fuer jedes Licht der Szene
+LIGHTS = (
+    ("directional", "sun_dir", SUN_LIGHT_COLOR, SUN_LIGHT_DIRECTION),
+    ("ambient", "ambient", AMBIENT_LIGHT_COLOR, None),
+)
+LIGHT_TYPES = {"directional": DirectionalLight, "ambient": AmbientLight}
 
 
 class Universe(object):
@@ -19,62 +33,67 @@ class Universe(object):
         :return:
         '''
         self.base = base
+        # Gemeinsamer Elternknoten fuer alle Himmelskoerper
+        self.sceneRoot = render.attachNewNode('sceneRoot')
         self.initPointLight()
 
 
     def initPointLight(self):
-        plight = PointLight('plight')
-        plight.setColor(VBase4(0.8, 0.8, 0.8, 1))
-        plnp = render.attachNewNode(plight)
-        plnp.setPos(0, 0, 3.8)
-        render.setLight(plnp)
-
-
-        plight2 = PointLight('plight')
-        plight2.setColor(VBase4(0.8, 0.8, 0.8, 1))
-        plnp2 = render.attachNewNode(plight2)
-        plnp2.setPos(0, 0, -3.8)
-        render.setLight(plnp2)
-
-        plight3 = PointLight('plight')
-        plight3.setColor(VBase4(0.8, 0.8, 0.8, 1))
-        plnp3 = render.attachNewNode(plight3)
-        plnp3.setPos(3.8, 0, 0)
-        render.setLight(plnp3)
-
-        plight4 = PointLight('plight')
-        plight4.setColor(VBase4(0.8, 0.8, 0.8, 1))
-        plnp4 = render.attachNewNode(plight4)
-        plnp4.setPos(-3.8, 0, 0)
-        render.setLight(plnp4)
-
-        plight5 = PointLight('plight')
-        plight5.setColor(VBase4(0.8, 0.8, 0.8, 1))
-        plnp5 = render.attachNewNode(plight5)
-        plnp5.setPos(0, -3.8, 0)
-        render.setLight(plnp5)
-
-        plight6 = PointLight('plight')
-        plight6.setColor(VBase4(0.8, 0.8, 0.8, 1))
-        plnp6 = render.attachNewNode(plight6)
-        plnp6.setPos(0, 3.8, 0)
-        render.setLight(plnp6)
-        #render.setShaderAuto()
-        base.setBackgroundColor(0, 0, 0)
-        base.cam.lookAt(0, 0, 0)
+        # Die Lichter kommen aus der Tabelle LIGHTS: ein gerichtetes Licht von
+        # oben (Blickrichtung der Kamera) plus ein Umgebungslicht
+        self.lightsRoot = render.attachNewNode('lightsRoot')
+        self.lights = []
+
+        for kind, name, color, direction in LIGHTS:
+            light = LIGHT_TYPES[kind](name)
+            light.setColor(color)
+            if direction is not None:
+                light.setDirection(direction)
+            self.lights.append(self.lightsRoot.attachNewNode(light))
+
+        for lnp in self.lights:
+            render.setLight(lnp)
+        # Kein render.setShaderAuto(): der Shader-Generator wuerde pro Pixel
+        # beleuchten, die Fixed-Function-Pipeline rechnet pro Vertex
+        self.base.setBackgroundColor(0, 0, 0)
+        self.base.cam.lookAt(0, 0, 0)
 
     def initSky(self):
         # Load the model for the sky
-        self.sky = loader.loadModel("../../models/solar_sky_sphere")
-        # Load the texture for the sky.
-        self.sky_tex = loader.loadTexture("../../models/stars_1k_tex.jpg")
+        self.sky = loader.loadModel(SKY_MODEL_PATH)
+        # Den Himmel an die Kamera haengen, damit er ihr folgt; der Compass
+        # haelt die Ausrichtung relativ zu render fest
+        self.sky.reparentTo(self.base.camera)
+        self.sky.setCompass()
+        # Zuerst und ohne Tiefenpuffer zeichnen, die Planeten ueberdecken ihn
+        self.sky.setBin('background', 0)
+        self.sky.setDepthWrite(False)
+        self.sky.setDepthTest(False)
+        # Der Sternenhimmel braucht keine Beleuchtung
+        self.sky.setLightOff()
+        # Scale the size of the sky.
+        self.sky.setScale(10)
+        # Die Textur im Lade-Thread lesen; bis dahin bleibt der Himmel schwarz
+        self.sky.hide()
+        taskMgr.add(self.loadSkyTexTask, "loadSkyTex", taskChain="textureLoader")
+
+    def loadSkyTexTask(self, task):
+        # laeuft im Thread "textureLoader"
+        try:
+            tex = loader.loadTexture(STARS_TEXTURE_PATH)
+        except IOError as e:
+            print("Warning: Could not load texture %s: %s" % (STARS_TEXTURE_PATH, e))
+            return Task.done
+        # Den Szenengraph nur im Haupt-Thread aendern
+        taskMgr.add(self.skyTexLoaded, "skyTexLoaded", extraArgs=[tex])
+        return Task.done
+
+    def skyTexLoaded(self, tex):
+        self.sky_tex = tex
+        # Beim Hochladen als DXT1 komprimieren und Mipmaps verwenden
+        self.sky_tex.setCompression(Texture.CMDxt1)
+        self.sky_tex.setMinfilter(Texture.FTLinearMipmapLinear)
         # Set the sky texture to the sky model
         self.sky.setTexture(self.sky_tex, 1)
-        # Parent the sky model to the render node so that the sky is rendered
-        self.sky.reparentTo(render)
-        # Scale the size of the sky.
-        self.sky.setScale(40)
-
-
-
-
+        self.sky.show()
+        return Task.done